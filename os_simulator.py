@@ -1,8 +1,10 @@
 from enum import Enum
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from collections import deque
+from itertools import count
+import heapq
 import random
-import time
+import sys
 
 
 class ProcessState(Enum):
@@ -13,46 +15,62 @@ class ProcessState(Enum):
     FINALIZADO = "Finalizado"
 
 
+# Códigos inteiros dos estados, usados internamente (comparação direta de int)
+PRONTO, EXECUTANDO, BLOQUEADO, FINALIZADO = 0, 1, 2, 3
+STATE_NAMES = tuple(state.value for state in ProcessState)
+
+
 class Process:
     """Representa um processo no sistema operacional."""
+
+    __slots__ = ("pid", "name", "cpu_time", "cpu_remaining", "memory", "priority", "state",
+                 "arrival_cycle", "finish_cycle", "turnaround_cycles", "waiting_cycles", "_ready_gen")
     
-    def __init__(self, pid: int, name: str, cpu_time: int, memory: int, priority: int):
+    def __init__(self, pid: int, name: str, cpu_time: int, memory: int, priority: int,
+                 arrival_cycle: int = 0):
         self.pid = pid
         self.name = name
         self.cpu_time = max(1, cpu_time)
         self.cpu_remaining = self.cpu_time
         self.memory = memory
         self.priority = priority
-        self.state = ProcessState.PRONTO
-        self.arrival_time = time.time()
-        self.finish_time: Optional[float] = None
+        self.state: int = PRONTO
+        self.arrival_cycle = arrival_cycle
+        self.finish_cycle: Optional[int] = None
+        self.turnaround_cycles: Optional[int] = None
+        self.waiting_cycles: Optional[int] = None
+        self._ready_gen = 0  # invalida entradas antigas na fila de prontos
 
     def __repr__(self):
-        return f"<Process pid={self.pid} name={self.name} state={self.state.value}>"
+        return f"<Process pid={self.pid} name={self.name} state={STATE_NAMES[self.state]}>"
 
-    @property
-    def turnaround_time(self) -> Optional[float]:
-        """Tempo total até finalização."""
-        if self.finish_time:
-            return self.finish_time - self.arrival_time
-        return None
-
-    @property
-    def waiting_time(self) -> Optional[float]:
-        """Tempo de espera (turnaround - CPU real)."""
-        if self.turnaround_time:
-            return self.turnaround_time - self.cpu_time
-        return None
+    def finish(self, cycle: int):
+        """Finaliza o processo e calcula uma única vez turnaround e espera (turnaround - CPU real)."""
+        self.state = FINALIZADO
+        self.finish_cycle = cycle
+        self.turnaround_cycles = cycle - self.arrival_cycle
+        # nunca negativo: a CPU usada não excede os ciclos decorridos desde a chegada
+        self.waiting_cycles = self.turnaround_cycles - (self.cpu_time - self.cpu_remaining)
 
 
 class OperatingSystem:
     """Simulador de um Sistema Operacional didático."""
     
     def __init__(self, quantum: int = 2):
-        self.processes: List[Process] = []
+        self.processes: Dict[int, Process] = {}  # apenas processos ativos, por PID
+        self._by_pid: Dict[int, Process] = {}  # índice PID -> processo (ativos e finalizados)
         self.next_pid = 1
+        self._global_cycle = 0  # relógio da simulação, em ciclos de CPU
         self.quantum = quantum
-        self.rr_queue = deque()  # fila persistente de Round Robin
+        # Anel persistente de Round Robin: (processo, geração), como na fila de prontos
+        self._rr_ring: List[tuple] = []
+        self._rr_head = 0  # próxima posição a ser visitada
+        self._rr_dead = 0  # entradas do anel que ficaram obsoletas, removidas na volta completa
+        self._ready = deque()  # fila de prontos com remoção preguiçosa: (processo, geração)
+        # Heaps de prontos com remoção preguiçosa: (chave, pid, seq, processo)
+        self._sjf_heap: List[tuple] = []
+        self._prio_heap: List[tuple] = []
+        self._heap_seq = count()  # desempate para entradas duplicadas do mesmo processo
 
     # -------------------------------
     # CRUD de Processos
@@ -60,28 +78,57 @@ class OperatingSystem:
 
     def create_process(self, name: str, cpu_time: int = 5, memory: int = 100, priority: int = 3) -> Process:
         """Cria um novo processo e adiciona à fila RR."""
-        process = Process(self.next_pid, name, cpu_time, memory, priority)
-        self.processes.append(process)
-        self.rr_queue.append(process)
+        process = Process(self.next_pid, name, cpu_time, memory, priority, self._global_cycle)
+        self.processes[process.pid] = process
+        self._by_pid[process.pid] = process
+        self._enqueue_ready(process)
         self.next_pid += 1
         print(f"Processo criado: PID={process.pid}, Nome={process.name}, CPU={cpu_time}, MEM={memory}, PRIO={priority}")
         return process
 
+    def create_processes_bulk(self, specs: Sequence[Tuple[Optional[str], int, int, int]]) -> List[Process]:
+        """Cria vários processos de uma vez a partir de (nome, cpu, mem, prio), com um único aviso.
+
+        Um nome ``None`` vira ``P<pid>``.
+        """
+        first_pid = self.next_pid
+        arrival = self._global_cycle
+        created = [Process(pid, name if name is not None else f"P{pid}", cpu_time, memory, priority, arrival)
+                   for pid, (name, cpu_time, memory, priority) in zip(range(first_pid, first_pid + len(specs)), specs)]
+        if not created:
+            return created
+
+        self.processes.update((p.pid, p) for p in created)
+        self._by_pid.update((p.pid, p) for p in created)
+        entries = [(p, p._ready_gen) for p in created]
+        self._rr_ring[self._rr_head:self._rr_head] = entries
+        self._rr_head += len(entries)
+        self._ready.extend(entries)
+        seq = self._heap_seq
+        self._sjf_heap.extend((p.cpu_remaining, p.pid, next(seq), p) for p in created)
+        self._prio_heap.extend((p.priority, p.pid, next(seq), p) for p in created)
+        heapq.heapify(self._sjf_heap)
+        heapq.heapify(self._prio_heap)
+        self._maybe_compact_queues()
+        self.next_pid += len(created)
+        print(f"Criados {len(created)} processos (PID {first_pid} a {self.next_pid - 1}).")
+        return created
+
     def list_processes(self):
         """Lista todos os processos e seus estados."""
-        if not self.processes:
+        if not self._by_pid:
             print("Nenhum processo criado.")
             return
         
         print("\nPID | Nome           | CPU (restante/total) | MEM | PRIO | Estado")
         print("-" * 65)
-        for p in self.processes:
+        for p in self._by_pid.values():
             print(f"{p.pid:3} | {p.name:14} | {p.cpu_remaining:2}/{p.cpu_time:2}               | "
-                  f"{p.memory:3} | {p.priority:4} | {p.state.value}")
+                  f"{p.memory:3} | {p.priority:4} | {STATE_NAMES[p.state]}")
 
     def get_process_by_pid(self, pid: int) -> Optional[Process]:
         """Busca um processo pelo PID."""
-        return next((p for p in self.processes if p.pid == pid), None)
+        return self._by_pid.get(pid)
 
     # -------------------------------
     # Controle de Estado
@@ -93,10 +140,15 @@ class OperatingSystem:
         if not process:
             print(f"Processo {pid} não encontrado.")
             return
-        if process.state == ProcessState.FINALIZADO:
+        if process.state == FINALIZADO:
             print(f"Processo {pid} já está finalizado.")
             return
-        process.state = ProcessState.BLOQUEADO
+        if process.state == BLOQUEADO:
+            print(f"Processo {pid} já está bloqueado.")
+            return
+        process.state = BLOQUEADO
+        process._ready_gen += 1
+        self._rr_dead += 1
         print(f"Processo {pid} bloqueado.")
 
     def unblock_process(self, pid: int):
@@ -105,8 +157,9 @@ class OperatingSystem:
         if not process:
             print(f"Processo {pid} não encontrado.")
             return
-        if process.state == ProcessState.BLOQUEADO:
-            process.state = ProcessState.PRONTO
+        if process.state == BLOQUEADO:
+            process.state = PRONTO
+            self._enqueue_ready(process)
             print(f"Processo {pid} desbloqueado.")
         else:
             print(f"Processo {pid} não está bloqueado.")
@@ -117,114 +170,301 @@ class OperatingSystem:
         if not process:
             print(f"Processo {pid} não encontrado.")
             return
-        process.state = ProcessState.FINALIZADO
+        if process.state == FINALIZADO:
+            print(f"Processo {pid} já está finalizado.")
+            return
+        if process.state == PRONTO:
+            self._rr_dead += 1  # se bloqueado, a entrada já foi contada no bloqueio
+        process.finish(self._global_cycle)
+        process._ready_gen += 1
         process.cpu_remaining = 0
-        process.finish_time = time.time()
+        del self.processes[pid]
         print(f"Processo {pid} encerrado.")
 
     # -------------------------------
     # Seleção de Processos
     # -------------------------------
 
+    def _enqueue_ready(self, process: Process):
+        """Insere um processo que acabou de ficar PRONTO nas filas de prontos."""
+        entry = (process, process._ready_gen)
+        self._ready.append(entry)
+        # entra no fim da rotação de RR, isto é, logo antes da cabeça
+        self._rr_ring.insert(self._rr_head, entry)
+        self._rr_head += 1
+        self._push_ready(process)
+        self._maybe_compact_queues()
+
+    def _push_ready(self, process: Process):
+        """Insere o processo nos heaps de SJF e PRIO."""
+        seq = next(self._heap_seq)
+        heapq.heappush(self._sjf_heap, (process.cpu_remaining, process.pid, seq, process))
+        heapq.heappush(self._prio_heap, (process.priority, process.pid, seq, process))
+
+    @staticmethod
+    def _is_live(entry: tuple) -> bool:
+        """Uma entrada (processo, geração) vale enquanto o processo segue PRONTO na mesma geração."""
+        proc, gen = entry
+        return proc.state == PRONTO and proc._ready_gen == gen
+
+    def _maybe_compact_queues(self):
+        """Reconstrói filas e heaps quando as entradas obsoletas passam do dobro dos processos ativos.
+
+        Cada bloqueio/desbloqueio ou finalização deixa entradas antigas que só
+        saem ao chegar à frente; a reconstrução mantém apenas a entrada válida
+        de cada processo PRONTO, limitando o tamanho a O(processos ativos).
+        """
+        limit = 2 * len(self.processes)
+        if max(len(self._ready), len(self._rr_ring), len(self._sjf_heap), len(self._prio_heap)) <= limit:
+            return
+
+        is_live = self._is_live
+        self._ready = deque(e for e in self._ready if is_live(e))
+        self._rr_head = sum(1 for e in self._rr_ring[:self._rr_head] if is_live(e))
+        self._rr_ring = [e for e in self._rr_ring if is_live(e)]
+        self._rr_dead = 0
+        seq = self._heap_seq
+        self._sjf_heap = [(p.cpu_remaining, p.pid, next(seq), p) for p, _ in self._ready]
+        self._prio_heap = [(p.priority, p.pid, next(seq), p) for p, _ in self._ready]
+        heapq.heapify(self._sjf_heap)
+        heapq.heapify(self._prio_heap)
+
+    def _prune_ready(self):
+        """Descarta do início da fila de prontos as entradas obsoletas."""
+        ready = self._ready
+        while ready and not self._is_live(ready[0]):
+            ready.popleft()
+
     def get_ready_processes(self) -> List[Process]:
-        return [p for p in self.processes if p.state == ProcessState.PRONTO]
+        return [p for p in self.processes.values() if p.state == PRONTO]
 
     def select_next_process_fifo(self) -> Optional[Process]:
-        ready = self.get_ready_processes()
-        return ready[0] if ready else None
+        self._prune_ready()
+        return self._ready[0][0] if self._ready else None
 
     def select_next_process_sjf(self) -> Optional[Process]:
-        ready = self.get_ready_processes()
-        return min(ready, key=lambda p: p.cpu_remaining) if ready else None
+        """Topo do heap de SJF, descartando entradas obsoletas.
+
+        Se o topo ainda está PRONTO mas com chave antiga (rodou uma fatia de
+        RR), ele é reinserido com o ``cpu_remaining`` atual.
+        """
+        heap = self._sjf_heap
+        while heap:
+            remaining, pid, _, proc = heap[0]
+            if proc.state != PRONTO:
+                heapq.heappop(heap)
+            elif proc.cpu_remaining != remaining:
+                heapq.heapreplace(heap, (proc.cpu_remaining, pid, next(self._heap_seq), proc))
+            else:
+                return proc
+        return None
 
     def select_next_process_prio(self) -> Optional[Process]:
-        ready = self.get_ready_processes()
-        return min(ready, key=lambda p: p.priority) if ready else None
+        """Topo do heap de prioridades, descartando processos que não estão prontos."""
+        heap = self._prio_heap
+        while heap:
+            proc = heap[0][3]
+            if proc.state == PRONTO:
+                return proc
+            heapq.heappop(heap)
+        return None
 
     def select_next_process_rr(self) -> Optional[Process]:
-        """Round Robin persistente com fila rotativa."""
-        while self.rr_queue:
-            proc = self.rr_queue.popleft()
-            if proc.state == ProcessState.PRONTO:
-                return proc
+        """Round Robin persistente sobre um anel com cabeça rotativa.
+
+        Entradas de processos bloqueados ou finalizados ficam obsoletas e são
+        puladas, e removidas quando a cabeça dá a volta no anel; o desbloqueio
+        reinsere o processo no fim da rotação.
+        """
+        for _ in range(len(self._rr_ring)):
+            if self._rr_head >= len(self._rr_ring):
+                self._rr_head = 0
+                if self._rr_dead:
+                    self._rr_ring = [e for e in self._rr_ring if self._is_live(e)]
+                    self._rr_dead = 0
+                    if not self._rr_ring:
+                        return None
+            entry = self._rr_ring[self._rr_head]
+            self._rr_head += 1
+            if self._is_live(entry):
+                return entry[0]
         return None
 
     # -------------------------------
     # Execução da Simulação
     # -------------------------------
 
-    def run_simulation(self, algorithm: str = "fifo"):
-        """Executa a simulação com o algoritmo escolhido."""
+    def run_simulation(self, algorithm: str = "fifo", verbose: bool = False):
+        """Executa a simulação com o algoritmo escolhido.
+
+        Com ``verbose`` o rastro ciclo a ciclo é acumulado e escrito de uma
+        só vez ao final, em vez de um ``print`` por ciclo.
+        """
         algorithm = algorithm.lower()
+        selectors = {
+            "fifo": self.select_next_process_fifo,
+            "sjf": self.select_next_process_sjf,
+            "prio": self.select_next_process_prio,
+            "rr": self.select_next_process_rr,
+        }
+        select_next = selectors.get(algorithm)
+        if select_next is None:
+            print(f"Algoritmo '{algorithm}' inválido.")
+            return
+        is_rr = algorithm == "rr"
+
         print(f"\nExecutando simulação por {algorithm.upper()}...\n")
 
-        cycle = 0
+        start_cycle = self._global_cycle
+        trace = [] if verbose else None  # (ciclo, processo, restante)
+        status = None
 
         while True:
-            ready = self.get_ready_processes()
+            self._prune_ready()
 
-            if not ready:
-                non_finalized = [p for p in self.processes if p.state != ProcessState.FINALIZADO]
-                if not non_finalized:
-                    print("\n✓ Todos os processos finalizados!")
+            if not self._ready:
+                if not self.processes:
+                    status = "\n✓ Todos os processos finalizados!"
                 else:
-                    print("\n⚠ Nenhum processo PRONTO. Existem processos bloqueados ou em espera.")
+                    status = "\n⚠ Nenhum processo PRONTO. Existem processos bloqueados ou em espera."
                 break
 
             # Seleciona processo
-            if algorithm == "fifo":
-                current = self.select_next_process_fifo()
-            elif algorithm == "sjf":
-                current = self.select_next_process_sjf()
-            elif algorithm == "prio":
-                current = self.select_next_process_prio()
-            elif algorithm == "rr":
-                current = self.select_next_process_rr()
-                if current:
-                    self.rr_queue.append(current)  # reenqueue para o final
-            else:
-                print(f"Algoritmo '{algorithm}' inválido.")
-                return
-
+            current = select_next()
             if not current:
                 break
 
-            # Executa uma unidade de CPU
-            current.state = ProcessState.EXECUTANDO
-            current.cpu_remaining -= 1
-            cycle += 1
-            print(f"→ Ciclo {cycle}: Executando {current.name} (PID {current.pid}) | Restante: {current.cpu_remaining}")
-
-            # Finaliza se necessário
-            if current.cpu_remaining <= 0:
-                current.state = ProcessState.FINALIZADO
-                current.finish_time = time.time()
-                print(f"   ✓ Processo {current.pid} finalizado!")
+            # FIFO, SJF e PRIO não são preemptivos: o escolhido roda até o fim.
+            # RR roda no máximo um quantum antes de voltar à fila.
+            if is_rr:
+                self._run_slice(current, min(self.quantum, current.cpu_remaining), trace)
             else:
-                current.state = ProcessState.PRONTO
+                self._run_slice(current, current.cpu_remaining, trace)
 
-        print(f"\nSimulação concluída em {cycle} ciclos!\n")
+        if trace:
+            sys.stdout.write(self._format_trace(trace, start_cycle))
+        if status:
+            print(status)
+        print(f"\nSimulação concluída em {self._global_cycle - start_cycle} ciclos!\n")
         self.show_metrics()
 
+    def _run_slice(self, current: Process, slice_len: int, trace: Optional[list] = None):
+        """Executa ``slice_len`` ciclos de CPU seguidos do processo, sem reescalonar.
+
+        O estado só é escrito na finalização: nada observa o processo durante
+        a fatia, então ele permanece PRONTO em vez de alternar com EXECUTANDO.
+        """
+        start = self._global_cycle
+        if trace is not None:
+            remaining = current.cpu_remaining
+            for tick in range(1, slice_len + 1):
+                trace.append((start + tick, current, remaining - tick))
+
+        current.cpu_remaining -= slice_len
+        self._global_cycle += slice_len
+
+        # Finaliza se necessário
+        if current.cpu_remaining <= 0:
+            current.finish(self._global_cycle)
+            del self.processes[current.pid]
+            self._rr_dead += 1
+
+    @staticmethod
+    def _format_trace(trace, start_cycle: int = 0) -> str:
+        """Formata o rastro em um único texto, com ciclos contados desde o início da execução."""
+        lines = []
+        for cycle, proc, remaining in trace:
+            lines.append(f"→ Ciclo {cycle - start_cycle}: Executando {proc.name} (PID {proc.pid}) | Restante: {remaining}\n")
+            if remaining <= 0:
+                lines.append(f"   ✓ Processo {proc.pid} finalizado!\n")
+        return "".join(lines)
+
     # -------------------------------
     # Métricas
     # -------------------------------
 
     def show_metrics(self):
         """Exibe métricas de desempenho."""
-        print("\n--- Métricas de Processos ---")
-        for p in self.processes:
-            t = p.turnaround_time
-            w = p.waiting_time
-            print(f"PID {p.pid:2} | {p.name:10} | Estado: {p.state.value:11} | "
-                  f"Turnaround: {t:.2f}s | Espera: {w:.2f}s" if t else
-                  f"PID {p.pid:2} | {p.name:10} | Estado: {p.state.value}")
+        lines = ["\n--- Métricas de Processos ---"]
+        for p in self._by_pid.values():
+            t = p.turnaround_cycles
+            if t is not None:
+                lines.append(f"PID {p.pid:2} | {p.name:10} | Estado: {STATE_NAMES[p.state]:11} | "
+                             f"Turnaround: {t} ciclos | Espera: {p.waiting_cycles} ciclos")
+            else:
+                lines.append(f"PID {p.pid:2} | {p.name:10} | Estado: {STATE_NAMES[p.state]}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # -------------------------------
 # Interface CLI
 # -------------------------------
 
+_rng = random.Random()  # gerador próprio da CLI para os valores padrão
+
+
+def _do_create(os_sim: OperatingSystem, parts: List[str]):
+    if len(parts) < 2:
+        print("Uso: create <nome> [cpu] [mem] [prio]")
+        return
+    name = " ".join(parts[1:-3]) if len(parts) > 4 else parts[1]
+    randint = _rng.randint
+    try:
+        cpu = int(parts[-3]) if len(parts) >= 4 else randint(3, 8)
+        mem = int(parts[-2]) if len(parts) >= 5 else randint(50, 200)
+        prio = int(parts[-1]) if len(parts) >= 6 else randint(1, 5)
+    except ValueError:
+        cpu, mem, prio = randint(3, 8), randint(50, 200), randint(1, 5)
+    os_sim.create_process(name, cpu, mem, prio)
+
+
+def _do_createn(os_sim: OperatingSystem, parts: List[str]):
+    try:
+        quantity = int(parts[1]) if len(parts) >= 2 else 0
+    except ValueError:
+        quantity = 0
+    if quantity <= 0:
+        print("Uso: createn <quantidade>")
+        return
+    randint = _rng.randint
+    specs = [(None, randint(3, 8), randint(50, 200), randint(1, 5)) for _ in range(quantity)]
+    os_sim.create_processes_bulk(specs)
+
+
+def _do_list(os_sim: OperatingSystem, parts: List[str]):
+    os_sim.list_processes()
+
+
+def _do_run(os_sim: OperatingSystem, parts: List[str]):
+    if len(parts) < 2:
+        print("Uso: run <fifo|sjf|rr|prio> [-v]")
+        return
+    os_sim.run_simulation(parts[1], verbose="-v" in parts[2:])
+
+
+def _do_block(os_sim: OperatingSystem, parts: List[str]):
+    os_sim.block_process(int(parts[1]))
+
+
+def _do_unblock(os_sim: OperatingSystem, parts: List[str]):
+    os_sim.unblock_process(int(parts[1]))
+
+
+def _do_kill(os_sim: OperatingSystem, parts: List[str]):
+    os_sim.kill_process(int(parts[1]))
+
+
+DISPATCH: Dict[str, Callable[[OperatingSystem, List[str]], None]] = {
+    "create": _do_create,
+    "createn": _do_createn,
+    "list": _do_list,
+    "run": _do_run,
+    "block": _do_block,
+    "unblock": _do_unblock,
+    "kill": _do_kill,
+}
+
+
 def main():
     os_sim = OperatingSystem()
 
@@ -233,8 +473,9 @@ def main():
     print("=" * 60)
     print("\nComandos disponíveis:")
     print("  create <nome> [cpu] [mem] [prio]  - Cria um processo")
+    print("  createn <quantidade>              - Cria vários processos aleatórios")
     print("  list                              - Lista todos os processos")
-    print("  run <algoritmo>                   - Executa escalonamento (fifo, sjf, rr, prio)")
+    print("  run <algoritmo> [-v]              - Executa escalonamento (fifo, sjf, rr, prio)")
     print("  block <PID>                       - Bloqueia um processo")
     print("  unblock <PID>                     - Desbloqueia um processo")
     print("  kill <PID>                        - Encerra um processo")
@@ -249,41 +490,13 @@ def main():
             parts = command.split()
             cmd = parts[0].lower()
 
-            if cmd == "create":
-                if len(parts) < 2:
-                    print("Uso: create <nome> [cpu] [mem] [prio]")
-                    continue
-                name = " ".join(parts[1:-3]) if len(parts) > 4 else parts[1]
-                try:
-                    cpu = int(parts[-3]) if len(parts) >= 4 else random.randint(3, 8)
-                    mem = int(parts[-2]) if len(parts) >= 5 else random.randint(50, 200)
-                    prio = int(parts[-1]) if len(parts) >= 6 else random.randint(1, 5)
-                except ValueError:
-                    cpu, mem, prio = random.randint(3, 8), random.randint(50, 200), random.randint(1, 5)
-                os_sim.create_process(name, cpu, mem, prio)
-
-            elif cmd == "list":
-                os_sim.list_processes()
-
-            elif cmd == "run":
-                if len(parts) < 2:
-                    print("Uso: run <fifo|sjf|rr|prio>")
-                    continue
-                os_sim.run_simulation(parts[1])
-
-            elif cmd == "block":
-                os_sim.block_process(int(parts[1]))
-
-            elif cmd == "unblock":
-                os_sim.unblock_process(int(parts[1]))
-
-            elif cmd == "kill":
-                os_sim.kill_process(int(parts[1]))
-
-            elif cmd == "exit":
+            if cmd == "exit":
                 print("Encerrando o sistema...")
                 break
 
+            handler = DISPATCH.get(cmd)
+            if handler:
+                handler(os_sim, parts)
             else:
                 print(f"Comando '{cmd}' não reconhecido.")
 
@@ -292,4 +505,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()